@@ -0,0 +1,115 @@
+import json
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.database import get_session
+from app.models import CONFIG_VERSION_KEY, SystemConfig, ValueType
+
+# session.info key set by a flush that wrote SystemConfig rows
+_PENDING_CONFIG_WRITES = "pending_config_writes"
+
+# How long a loaded snapshot is trusted before the version row is checked again
+CONFIG_TTL_SECONDS = 30.0
+
+# Bumped when a session that wrote SystemConfig rows commits, so this process never serves its own
+# stale values while waiting out the TTL
+_CONFIG_VERSION = 0
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    local_version: int = -1
+    db_version: Optional[str] = None
+    checked_at: float = 0.0
+    # key -> (value, value_type) as stored; never modified once the snapshot is published
+    values: dict[str, tuple[str, ValueType]] = field(default_factory=dict)
+    # key -> value cast according to value_type, memoised on first read. Threads racing on a key store the
+    # same value, so the unlocked writes are harmless.
+    typed: dict[str, Any] = field(default_factory=dict)
+
+
+# Replaced as a whole on reload rather than cleared and refilled, since get_config() runs on worker threads
+_snapshot = _Snapshot()
+
+
+def get_config(key: str) -> Any:
+    """Typed, committed value of a SystemConfig entry, or None if it doesn't exist.
+
+    Reads are a dict lookup; the database is only hit after a local write, or once per TTL to compare
+    the version counter that every SystemConfig write increments.
+    """
+    snapshot = _snapshot
+    if snapshot.local_version != _CONFIG_VERSION or time.monotonic() - snapshot.checked_at > CONFIG_TTL_SECONDS:
+        snapshot = _revalidate(snapshot)
+
+    if key in snapshot.typed:
+        return snapshot.typed[key]
+    entry = snapshot.values.get(key)
+    if entry is None:
+        return None
+    typed = snapshot.typed[key] = _cast_value(*entry)
+    return typed
+
+
+def clear_config_cache() -> None:
+    """Drop the cached snapshot so the next get_config() reloads from the database."""
+    global _snapshot
+    _snapshot = _Snapshot()
+
+
+def _revalidate(snapshot: _Snapshot) -> _Snapshot:
+    global _snapshot
+    local_version = _CONFIG_VERSION
+    # A session of its own, so a caller's flushed but uncommitted writes never end up in the shared snapshot
+    with get_session() as session:
+        db_version = session.exec(select(SystemConfig.value).where(SystemConfig.key == CONFIG_VERSION_KEY)).first()
+        if snapshot.local_version != local_version or snapshot.db_version != db_version:
+            rows = session.exec(
+                select(SystemConfig.key, SystemConfig.value, SystemConfig.value_type).where(
+                    SystemConfig.key != CONFIG_VERSION_KEY
+                )
+            ).all()
+            values = {row_key: (value, ValueType(value_type)) for row_key, value, value_type in rows}
+            snapshot = _Snapshot(local_version, db_version, time.monotonic(), values)
+        else:
+            snapshot = replace(snapshot, checked_at=time.monotonic())
+    _snapshot = snapshot
+    return snapshot
+
+
+def _cast_value(value: str, value_type: ValueType) -> Any:
+    match value_type:
+        case ValueType.INT:
+            return int(value)
+        case ValueType.BOOL:
+            return value.strip().lower() in ("true", "1", "yes", "on")
+        case ValueType.JSON:
+            return json.loads(value)
+        case _:
+            return value
+
+
+# Flushed changes only become visible to other sessions on commit, so the version is bumped then rather
+# than at flush time, and pending changes are forgotten on rollback
+
+
+@event.listens_for(Session, "after_flush")
+def _track_config_writes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, SystemConfig) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[_PENDING_CONFIG_WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_local_cache(session: Session) -> None:
+    global _CONFIG_VERSION
+    if session.info.pop(_PENDING_CONFIG_WRITES, False):
+        _CONFIG_VERSION += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_config_writes(session: Session) -> None:
+    session.info.pop(_PENDING_CONFIG_WRITES, None)
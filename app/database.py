@@ -13,6 +13,11 @@ def create_tables():
 
 
 def get_session():
+    """New session on the shared engine.
+
+    Objects are expired on commit, so touching them afterwards re-selects the row. Read-heavy code that
+    keeps using loaded objects after committing can open Session(ENGINE, expire_on_commit=False) instead.
+    """
     return Session(ENGINE)
 
 
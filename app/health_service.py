@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import Row, select as sa_select, true
+from sqlalchemy.orm import aliased, contains_eager, load_only
+from sqlmodel import Session, select, func, insert, text, desc, col
+
+from app.models import (
+    Alert,
+    AlertCreate,
+    Endpoint,
+    HealthCheck,
+    HealthCheckDetails,
+    HealthCheckResult,
+    PeriodType,
+    UptimeMetric,
+    UptimeStats,
+    create_health_check_partitions,
+    upsert_hourly_rollups,
+)
+
+# Number of hourly rollup buckets covered by each uptime period
+UPTIME_PERIOD_HOURS: dict[str, int] = {"24h": 24, "7d": 24 * 7, "30d": 24 * 30}
+
+
+def get_latest_check(session: Session, endpoint_id: int) -> Optional[HealthCheck]:
+    """Latest health check for an endpoint, loading only the columns held in ix_hc_latest_covering.
+
+    The query is answered by an index-only scan; other attributes are loaded on first access.
+    """
+    # SQLModel types these attributes as their values (or Mapped[...] through col()), not as ORM attributes
+    covered = (HealthCheck.status_code, HealthCheck.is_successful, HealthCheck.response_time_ms)
+    covered_columns = load_only(*covered)  # type: ignore[arg-type]
+    return session.exec(
+        select(HealthCheck)
+        .options(covered_columns)
+        .where(HealthCheck.endpoint_id == endpoint_id)
+        .order_by(desc(HealthCheck.checked_at))
+        .limit(1)
+    ).first()
+
+
+def get_response_time_percentiles(
+    session: Session, endpoint_id: int, since: datetime
+) -> tuple[Optional[int], Optional[int]]:
+    """p95 and p99 response times in milliseconds since a point in time, or None without responses.
+
+    The predicate matches the partial index ix_hc_rt_notnull, so failed checks are never read.
+    """
+    response_time = col(HealthCheck.response_time_ms)
+    p95, p99 = session.exec(
+        select(
+            func.percentile_cont(0.95).within_group(response_time),
+            func.percentile_cont(0.99).within_group(response_time),
+        ).where(
+            HealthCheck.endpoint_id == endpoint_id,
+            col(HealthCheck.checked_at) >= since,
+            response_time.is_not(None),
+        )
+    ).one()
+    return (round(p95) if p95 is not None else None, round(p99) if p99 is not None else None)
+
+
+def list_endpoint_rows(session: Session) -> list[Row]:
+    """Display columns of all endpoints as plain rows, for read-only list views.
+
+    Rows skip model construction, validation and the identity map; load Endpoint itself only to edit it.
+    """
+    # sqlmodel's select() only has typed overloads for up to four columns, so this uses SQLAlchemy's
+    columns = (col(Endpoint.id), col(Endpoint.name), col(Endpoint.url), col(Endpoint.is_active), col(Endpoint.tags))
+    return list(session.execute(sa_select(*columns).order_by(col(Endpoint.name))).all())
+
+
+def load_endpoints_with_recent_checks(session: Session, limit: int = 10) -> list[Endpoint]:
+    """All endpoints with their `limit` most recent health checks preloaded, newest first.
+
+    Endpoint.health_checks is lazy="raise", so list views have to go through a loader like this one.
+    """
+    # One LATERAL top-N per endpoint, each a short descent of ix_hc_latest_covering per partition
+    recent = (
+        select(HealthCheck)
+        .where(HealthCheck.endpoint_id == Endpoint.id)
+        .order_by(desc(HealthCheck.checked_at))
+        .limit(limit)
+        .lateral()
+    )
+    recent_check = aliased(HealthCheck, recent)
+    checks = contains_eager(Endpoint.health_checks.of_type(recent_check))  # type: ignore[attr-defined]
+    return list(
+        session.exec(
+            select(Endpoint)
+            .outerjoin(recent_check, true())
+            .options(checks)
+            .order_by(col(Endpoint.id), desc(recent_check.checked_at))
+        )
+        .unique()
+        .all()
+    )
+
+
+def get_uptime_stats(session: Session, endpoint_id: int, period: str) -> UptimeStats:
+    """Sum the hourly rollup buckets for an endpoint instead of scanning raw health checks."""
+    hours = UPTIME_PERIOD_HOURS.get(period)
+    if hours is None:
+        raise ValueError(f"Unknown uptime period: {period}")
+
+    current_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    since = current_hour - timedelta(hours=hours - 1)
+    total, successful = session.exec(
+        select(
+            func.coalesce(func.sum(UptimeMetric.total_checks), 0),
+            func.coalesce(func.sum(UptimeMetric.successful_checks), 0),
+        ).where(
+            UptimeMetric.endpoint_id == endpoint_id,
+            UptimeMetric.period_type == PeriodType.HOUR,
+            UptimeMetric.period_start >= since,
+        )
+    ).one()
+
+    uptime = successful * 100 / total if total else 0.0
+    return UptimeStats(
+        endpoint_id=endpoint_id,
+        period=period,
+        uptime_percentage=uptime,
+        total_checks=total,
+        successful_checks=successful,
+    )
+
+
+def bulk_insert_health_checks(session: Session, results: list[HealthCheckResult]) -> None:
+    """Write one monitor tick of health check results in a single executemany INSERT.
+
+    This is the write path for check results; session.add() is reserved for single-record admin writes.
+    Bulk inserts skip ORM events, so the hourly rollups are updated here in one upsert per tick.
+    """
+    if not results:
+        return
+
+    # checked_at comes from the database default, so read it back for the rollups and details rows
+    inserted = session.execute(
+        insert(HealthCheck).returning(
+            col(HealthCheck.id),
+            col(HealthCheck.endpoint_id),
+            col(HealthCheck.checked_at),
+            col(HealthCheck.is_successful),
+            sort_by_parameter_order=True,
+        ),
+        params=[result.to_dict() for result in results],
+    ).all()
+    upsert_hourly_rollups(
+        session.connection(), [(row.endpoint_id, row.checked_at, row.is_successful) for row in inserted]
+    )
+
+    details = [
+        {"health_check_id": row.id, "checked_at": row.checked_at, "response_headers": result.response_headers}
+        for row, result in zip(inserted, results)
+        if result.response_headers is not None
+    ]
+    if details:
+        session.execute(insert(HealthCheckDetails), params=details)
+    session.commit()
+
+
+def bulk_insert_alerts(session: Session, alerts: list[AlertCreate]) -> None:
+    """Write a batch of alerts in a single executemany INSERT; see bulk_insert_health_checks."""
+    if not alerts:
+        return
+
+    session.execute(insert(Alert), params=[alert.model_dump() for alert in alerts])
+    session.commit()
+
+
+def ensure_partitions(session: Session, months_ahead: int = 2) -> None:
+    """Make sure both partitioned tables have monthly partitions from last month up to months_ahead months ahead."""
+    create_health_check_partitions(session.connection(), months_ahead=months_ahead)
+    session.commit()
+
+
+def refresh_endpoint_status_view(session: Session) -> None:
+    """Recompute mv_endpoint_status without blocking dashboard reads of the previous snapshot."""
+    # The engine's one second statement timeout is meant for request queries, not a full recompute
+    session.execute(text("SET LOCAL statement_timeout = '60s'"))
+    session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_endpoint_status"))
+    session.commit()
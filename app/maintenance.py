@@ -0,0 +1,34 @@
+from nicegui import app, run
+
+from app.database import get_session
+from app.health_service import ensure_partitions, refresh_endpoint_status_view
+
+# How often to check that upcoming health_checks and health_check_details partitions exist. create_all()
+# does not convert a health_checks table created before partitioning; until it is converted by hand, the
+# maintenance job fails with "is not partitioned".
+PARTITION_CHECK_INTERVAL_SECONDS = 6 * 60 * 60
+# How stale the dashboard's mv_endpoint_status snapshot may get
+STATUS_VIEW_REFRESH_INTERVAL_SECONDS = 30
+
+
+def _ensure_partitions() -> None:
+    with get_session() as session:
+        ensure_partitions(session)
+
+
+def _refresh_endpoint_status_view() -> None:
+    with get_session() as session:
+        refresh_endpoint_status_view(session)
+
+
+def create():
+    """Register periodic database maintenance, called from startup.py"""
+
+    async def ensure_partitions_task() -> None:
+        await run.io_bound(_ensure_partitions)
+
+    async def refresh_endpoint_status_task() -> None:
+        await run.io_bound(_refresh_endpoint_status_view)
+
+    app.timer(PARTITION_CHECK_INTERVAL_SECONDS, ensure_partitions_task)
+    app.timer(STATUS_VIEW_REFRESH_INTERVAL_SECONDS, refresh_endpoint_status_task)
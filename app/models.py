@@ -1,21 +1,93 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from decimal import Decimal
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    Column,
+    Index,
+    UniqueConstraint,
+    ForeignKeyConstraint,
+    Computed,
+    String,
+    Text,
+    Numeric,
+    func,
+    desc,
+)
+from sqlalchemy import DDL, Connection, Enum as SAEnum, Integer, cast, event, text, update
+from sqlalchemy.orm import registry
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert as pg_insert
+from pydantic import ConfigDict
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Optional, List, Dict, Any, Iterable
+
+# Timestamps are naive UTC and filled in by the database, so inserts don't bind them per row
+UTC_NOW = func.timezone("utc", func.now())
+
+
+# Enumerated column values, stored as native PostgreSQL enum types
+
+
+class Severity(str, Enum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+class AlertType(str, Enum):
+    DOWN = "down"
+    SLOW = "slow"
+    ERROR = "error"
+
+
+class PeriodType(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class ValueType(str, Enum):
+    STRING = "string"
+    INT = "int"
+    BOOL = "bool"
+    JSON = "json"
+
+
+class ErrorType(str, Enum):
+    TIMEOUT = "timeout"
+    CONNECTION = "connection"
+    DNS = "dns"
+    TLS = "tls"
+    HTTP_STATUS = "http_status"
+    UNKNOWN = "unknown"
+
+
+def enum_column(enum: type[Enum], name: str, nullable: bool = False) -> Column:
+    """Column for a str Enum that stores member values (not names) as PostgreSQL enum labels."""
+    return Column(
+        SAEnum(enum, name=name, values_callable=lambda members: [m.value for m in members]), nullable=nullable
+    )
+
 
 # Persistent models (stored in database)
 
 
 class Endpoint(SQLModel, table=True):
     __tablename__ = "endpoints"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_endpoint_tags_gin", "tags", postgresql_using="gin"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200, description="Human-readable name for the endpoint")
-    url: str = Field(max_length=1000, description="URL to monitor")
+    url: str = Field(max_length=512, description="URL to monitor")
     check_interval: int = Field(default=300, description="Check interval in seconds")
     is_active: bool = Field(default=True, description="Whether monitoring is enabled")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW})
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW, "onupdate": UTC_NOW}
+    )
 
     # Expected response configuration
     expected_status_code: Optional[int] = Field(default=200, description="Expected HTTP status code")
@@ -23,69 +95,132 @@ class Endpoint(SQLModel, table=True):
 
     # Additional metadata
     description: str = Field(default="", max_length=500, description="Optional description")
-    tags: List[str] = Field(default=[], sa_column=Column(JSON), description="Tags for grouping endpoints")
+    tags: List[str] = Field(
+        default_factory=list, sa_column=Column(ARRAY(Text)), description="Tags for grouping endpoints"
+    )
+    # Generated by the database from the first tag, so filtering by environment can use a btree index
+    environment: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String(50), Computed("(tags[1]::varchar(50))", persisted=True), index=True),
+        description="Environment derived from the first tag",
+    )
 
     # Relationships
-    health_checks: List["HealthCheck"] = Relationship(back_populates="endpoint")
+    # Never lazy loaded: use load_endpoints_with_recent_checks() or an explicit selectinload()
+    health_checks: List["HealthCheck"] = Relationship(
+        back_populates="endpoint", sa_relationship_kwargs={"lazy": "raise", "order_by": "desc(HealthCheck.checked_at)"}
+    )
 
 
 class HealthCheck(SQLModel, table=True):
     __tablename__ = "health_checks"  # type: ignore[assignment]
+    __table_args__ = (
+        # Serves endpoint_id + checked_at range scans as well as the index-only "latest check" lookup
+        Index(
+            "ix_hc_latest_covering",
+            "endpoint_id",
+            desc("checked_at"),
+            postgresql_include=["id", "status_code", "is_successful", "response_time_ms"],
+        ),
+        # Latency aggregates only look at checks that got a response, which keeps this index small
+        Index(
+            "ix_hc_rt_notnull",
+            "endpoint_id",
+            "checked_at",
+            "response_time_ms",
+            postgresql_where=text("response_time_ms IS NOT NULL"),
+        ),
+        # Monthly range partitions, see create_health_check_partitions()
+        {"postgresql_partition_by": "RANGE (checked_at)"},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    # Columns are grouped by type (keys, integers, booleans, strings), so per-row result processing in the
+    # ORM runs same-typed converters back to back.
+
+    # Keys; the partition key has to be part of the primary key
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    checked_at: Optional[datetime] = Field(default=None, primary_key=True, sa_column_kwargs={"server_default": UTC_NOW})
     endpoint_id: int = Field(foreign_key="endpoints.id")
-    checked_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
-    # Response data
+    # Response data; all timings are whole milliseconds, rounded to the nearest integer
     status_code: Optional[int] = Field(default=None, description="HTTP status code received")
-    response_time_ms: Optional[Decimal] = Field(default=None, description="Response time in milliseconds")
+    response_size_bytes: Optional[int] = Field(default=None, description="Response size in bytes")
+    response_time_ms: Optional[int] = Field(default=None, description="Response time in milliseconds")
+    dns_lookup_time_ms: Optional[int] = Field(default=None, description="DNS lookup time in milliseconds")
+    tcp_connect_time_ms: Optional[int] = Field(default=None, description="TCP connection time in milliseconds")
+    tls_handshake_time_ms: Optional[int] = Field(default=None, description="TLS handshake time in milliseconds")
     is_successful: bool = Field(default=False, description="Whether the check was successful")
 
     # Error information
-    error_message: Optional[str] = Field(default=None, max_length=1000, description="Error message if check failed")
-    error_type: Optional[str] = Field(
-        default=None, max_length=100, description="Type of error (timeout, connection, etc.)"
+    error_message: Optional[str] = Field(default=None, max_length=256, description="Error message if check failed")
+    error_type: Optional[ErrorType] = Field(
+        default=None, sa_column=enum_column(ErrorType, "error_type", nullable=True), description="Type of error"
     )
 
-    # Additional metrics
-    dns_lookup_time_ms: Optional[Decimal] = Field(default=None, description="DNS lookup time in milliseconds")
-    tcp_connect_time_ms: Optional[Decimal] = Field(default=None, description="TCP connection time in milliseconds")
-    tls_handshake_time_ms: Optional[Decimal] = Field(default=None, description="TLS handshake time in milliseconds")
+    # Relationships
+    endpoint: Endpoint = Relationship(back_populates="health_checks", sa_relationship_kwargs={"lazy": "raise"})
+    details: Optional["HealthCheckDetails"] = Relationship(
+        back_populates="health_check",
+        # The database cascades the delete, so the ORM must not try to null out the details' key first
+        sa_relationship_kwargs={"uselist": False, "cascade": "all, delete-orphan", "passive_deletes": True},
+    )
 
-    # Response details
-    response_size_bytes: Optional[int] = Field(default=None, description="Response size in bytes")
+
+class HealthCheckDetails(SQLModel, table=True):
+    """Rarely read debugging data for a health check, kept off the hot health_checks rows."""
+
+    __tablename__ = "health_check_details"  # type: ignore[assignment]
+    # health_checks is keyed by (id, checked_at) since it is partitioned on checked_at
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["health_check_id", "checked_at"], ["health_checks.id", "health_checks.checked_at"], ondelete="CASCADE"
+        ),
+        # Partitioned by the same months as health_checks, so retention can detach or drop both together
+        {"postgresql_partition_by": "RANGE (checked_at)"},
+    )
+
+    health_check_id: Optional[int] = Field(default=None, primary_key=True)
+    checked_at: Optional[datetime] = Field(default=None, primary_key=True)
     response_headers: Optional[Dict[str, str]] = Field(
-        default=None, sa_column=Column(JSON), description="Response headers"
+        default=None, sa_column=Column(JSONB), description="Response headers"
     )
 
     # Relationships
-    endpoint: Endpoint = Relationship(back_populates="health_checks")
+    health_check: HealthCheck = Relationship(back_populates="details")
 
 
 class UptimeMetric(SQLModel, table=True):
     __tablename__ = "uptime_metrics"  # type: ignore[assignment]
+    # One row per bucket, so health check inserts can upsert into it. The constraint's index is also
+    # the only one on the table, matching the endpoint_id + period_type + period_start range lookups.
+    __table_args__ = (UniqueConstraint("endpoint_id", "period_type", "period_start", name="uq_um_bucket"),)
 
+    # Grouped by column type like HealthCheck: keys, integers, numerics, timestamps, then the enum
     id: Optional[int] = Field(default=None, primary_key=True)
-    endpoint_id: int = Field(foreign_key="endpoints.id", index=True)
-
-    # Time period
-    period_start: datetime = Field(index=True, description="Start of the metric period")
-    period_end: datetime = Field(index=True, description="End of the metric period")
-    period_type: str = Field(max_length=20, description="Type of period (hour, day, week, month)")
+    endpoint_id: int = Field(foreign_key="endpoints.id")
 
     # Uptime statistics
     total_checks: int = Field(default=0, description="Total number of checks in period")
     successful_checks: int = Field(default=0, description="Number of successful checks")
-    uptime_percentage: Decimal = Field(default=Decimal("0"), description="Uptime percentage for the period")
 
-    # Response time statistics
-    avg_response_time_ms: Optional[Decimal] = Field(default=None, description="Average response time in milliseconds")
-    min_response_time_ms: Optional[Decimal] = Field(default=None, description="Minimum response time in milliseconds")
-    max_response_time_ms: Optional[Decimal] = Field(default=None, description="Maximum response time in milliseconds")
-    p95_response_time_ms: Optional[Decimal] = Field(default=None, description="95th percentile response time")
-    p99_response_time_ms: Optional[Decimal] = Field(default=None, description="99th percentile response time")
+    # Response time statistics, in whole milliseconds rounded to the nearest integer
+    avg_response_time_ms: Optional[int] = Field(default=None, description="Average response time in milliseconds")
+    min_response_time_ms: Optional[int] = Field(default=None, description="Minimum response time in milliseconds")
+    max_response_time_ms: Optional[int] = Field(default=None, description="Maximum response time in milliseconds")
+    p95_response_time_ms: Optional[int] = Field(default=None, description="95th percentile response time")
+    p99_response_time_ms: Optional[int] = Field(default=None, description="99th percentile response time")
+
+    uptime_percentage: float = Field(
+        default=0.0,
+        sa_column=Column(Numeric(5, 2, asdecimal=False), nullable=False),
+        description="Uptime percentage for the period",
+    )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Time period
+    period_start: datetime = Field(description="Start of the metric period")
+    period_end: datetime = Field(description="End of the metric period")
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW})
+    period_type: PeriodType = Field(sa_column=enum_column(PeriodType, "period_type"), description="Type of period")
 
 
 class SystemConfig(SQLModel, table=True):
@@ -93,37 +228,270 @@ class SystemConfig(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     key: str = Field(unique=True, max_length=100, description="Configuration key")
-    value: str = Field(max_length=1000, description="Configuration value")
-    value_type: str = Field(max_length=20, default="string", description="Type of the value (string, int, bool, json)")
+    value: str = Field(max_length=512, description="Configuration value")
+    value_type: ValueType = Field(
+        default=ValueType.STRING, sa_column=enum_column(ValueType, "value_type"), description="Type of the value"
+    )
     description: str = Field(default="", max_length=500, description="Description of the configuration")
     is_system: bool = Field(default=False, description="Whether this is a system configuration")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW})
+    updated_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW, "onupdate": UTC_NOW}
+    )
 
 
 class Alert(SQLModel, table=True):
     __tablename__ = "alerts"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_alert_endpoint_triggered", "endpoint_id", "triggered_at"),
+        Index("ix_alert_trigger_data_gin", "trigger_data", postgresql_using="gin"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     endpoint_id: int = Field(foreign_key="endpoints.id")
 
     # Alert details
-    alert_type: str = Field(max_length=50, description="Type of alert (down, slow, error)")
-    severity: str = Field(max_length=20, default="medium", description="Alert severity (low, medium, high, critical)")
+    alert_type: AlertType = Field(sa_column=enum_column(AlertType, "alert_type"), description="Type of alert")
+    severity: Severity = Field(
+        default=Severity.MEDIUM, sa_column=enum_column(Severity, "severity"), description="Alert severity"
+    )
     title: str = Field(max_length=200, description="Alert title")
-    message: str = Field(max_length=1000, description="Alert message")
+    message: str = Field(max_length=512, description="Alert message")
 
     # Status and timing
     is_active: bool = Field(default=True, description="Whether the alert is still active")
-    triggered_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    triggered_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW})
     resolved_at: Optional[datetime] = Field(default=None, description="When the alert was resolved")
 
     # Trigger conditions
     trigger_data: Optional[Dict[str, Any]] = Field(
-        default=None, sa_column=Column(JSON), description="Data that triggered the alert"
+        default=None, sa_column=Column(JSONB), description="Data that triggered the alert"
     )
 
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, nullable=False, sa_column_kwargs={"server_default": UTC_NOW})
+
+
+# Monthly health_checks and health_check_details partitions
+
+PARTITIONED_TABLES = ("health_checks", "health_check_details")
+
+
+def create_health_check_partitions(
+    connection: Connection, months_ahead: int = 2, months_back: int = 1, tables: Iterable[str] = PARTITIONED_TABLES
+) -> None:
+    """Create the monthly partitions around the current month for each table, skipping existing ones."""
+    current_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    for table in tables:
+        for offset in range(-months_back, months_ahead + 1):
+            years, month_index = divmod(current_month.month - 1 + offset, 12)
+            start = current_month.replace(year=current_month.year + years, month=month_index + 1)
+            end = (start + timedelta(days=32)).replace(day=1)
+            connection.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {table}_{start:%Y%m} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+                )
+            )
+
+
+# health_check_details is created after health_checks, so each table gets its own partitions on create
+@event.listens_for(HealthCheck.__table__, "after_create")  # type: ignore[attr-defined]
+@event.listens_for(HealthCheckDetails.__table__, "after_create")  # type: ignore[attr-defined]
+def _create_initial_partitions(target, connection: Connection, **kw) -> None:
+    create_health_check_partitions(connection, tables=[target.name])
+
+
+# Hourly uptime rollup, kept up to date as health checks are written
+
+
+def upsert_hourly_rollups(connection: Connection, checks: Iterable[tuple[int, datetime, bool]]) -> None:
+    """Fold (endpoint_id, checked_at, is_successful) outcomes into hourly UptimeMetric buckets."""
+    buckets: Dict[tuple[int, datetime], List[int]] = {}
+    for endpoint_id, checked_at, is_successful in checks:
+        hour = checked_at.replace(minute=0, second=0, microsecond=0)
+        counts = buckets.setdefault((endpoint_id, hour), [0, 0])
+        counts[0] += 1
+        counts[1] += int(is_successful)
+    if not buckets:
+        return
+
+    table = UptimeMetric.__table__  # type: ignore[attr-defined]
+    stmt = pg_insert(table).values(
+        [
+            {
+                "endpoint_id": endpoint_id,
+                "period_start": hour,
+                "period_end": hour + timedelta(hours=1),
+                "period_type": PeriodType.HOUR,
+                "total_checks": total,
+                "successful_checks": successful,
+                "uptime_percentage": successful * 100 / total,
+            }
+            for (endpoint_id, hour), (total, successful) in buckets.items()
+        ]
+    )
+    total_checks = table.c.total_checks + stmt.excluded.total_checks
+    successful_checks = table.c.successful_checks + stmt.excluded.successful_checks
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_um_bucket",
+        set_={
+            "total_checks": total_checks,
+            "successful_checks": successful_checks,
+            "uptime_percentage": successful_checks * 100.0 / total_checks,
+        },
+    )
+    connection.execute(stmt)
+
+
+@event.listens_for(HealthCheck, "after_insert")
+def _rollup_health_check(mapper, connection: Connection, target: HealthCheck) -> None:
+    # Part of the primary key, so the server default has been read back by the time the row is inserted
+    assert target.checked_at is not None
+    upsert_hourly_rollups(connection, [(target.endpoint_id, target.checked_at, target.is_successful)])
+
+
+# Runs before the DELETE and reads the row itself, so it works even when the instance's attributes are expired
+@event.listens_for(HealthCheck, "before_delete")
+def _unroll_health_check(mapper, connection: Connection, target: HealthCheck) -> None:
+    checks = HealthCheck.__table__  # type: ignore[attr-defined]
+    table = UptimeMetric.__table__  # type: ignore[attr-defined]
+    total_checks = table.c.total_checks - 1
+    successful_checks = table.c.successful_checks - cast(checks.c.is_successful, Integer)
+    connection.execute(
+        update(table)
+        .where(
+            checks.c.id == target.id,
+            checks.c.checked_at == target.checked_at,
+            table.c.endpoint_id == checks.c.endpoint_id,
+            table.c.period_type == PeriodType.HOUR,
+            table.c.period_start == func.date_trunc("hour", checks.c.checked_at),
+        )
+        .values(
+            total_checks=total_checks,
+            successful_checks=successful_checks,
+            uptime_percentage=func.coalesce(successful_checks * 100.0 / func.nullif(total_checks, 0), 0),
+        )
+    )
+
+
+# SystemConfig version counter, bumped on every write so cached copies elsewhere know they are stale
+
+CONFIG_VERSION_KEY = "__version__"
+
+
+def bump_config_version(connection: Connection) -> None:
+    """Increment the counter stored in the CONFIG_VERSION_KEY row, creating it on first use."""
+    table = SystemConfig.__table__  # type: ignore[attr-defined]
+    stmt = pg_insert(table).values(
+        key=CONFIG_VERSION_KEY,
+        value="1",
+        value_type=ValueType.INT,
+        description="Incremented on every configuration change",
+        is_system=True,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.key],
+        set_={"value": cast(cast(table.c.value, Integer) + 1, String)},
+    )
+    connection.execute(stmt)
+
+
+@event.listens_for(SystemConfig, "after_insert")
+@event.listens_for(SystemConfig, "after_update")
+@event.listens_for(SystemConfig, "after_delete")
+def _bump_config_version(mapper, connection: Connection, target: SystemConfig) -> None:
+    if target.key != CONFIG_VERSION_KEY:
+        bump_config_version(connection)
+
+
+# Read-only views, kept out of SQLModel.metadata so create_all() does not create them as tables
+
+
+class ViewModel(SQLModel, registry=registry()):
+    pass
+
+
+class EndpointStatusView(ViewModel, table=True):
+    """Per-endpoint dashboard snapshot served from the mv_endpoint_status materialized view."""
+
+    __tablename__ = "mv_endpoint_status"  # type: ignore[assignment]
+
+    endpoint_id: int = Field(primary_key=True)
+    latest_check_id: Optional[int] = Field(default=None)
+    latest_checked_at: Optional[datetime] = Field(default=None)
+    uptime_24h: Optional[float] = Field(default=None)
+    uptime_7d: Optional[float] = Field(default=None)
+    uptime_30d: Optional[float] = Field(default=None)
+    avg_response_time_24h: Optional[float] = Field(default=None)
+    is_down: bool = Field(default=False)
+    consecutive_failures: int = Field(default=0)
+
+
+def _uptime_since(hours: int) -> str:
+    return (
+        f"ROUND(SUM(um.successful_checks) FILTER (WHERE um.period_start >= current_hour - INTERVAL '{hours - 1} hours')"
+        f" * 100.0 / NULLIF(SUM(um.total_checks) FILTER"
+        f" (WHERE um.period_start >= current_hour - INTERVAL '{hours - 1} hours'), 0), 2)"
+    )
+
+
+ENDPOINT_STATUS_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_endpoint_status AS
+SELECT
+    e.id AS endpoint_id,
+    latest.id AS latest_check_id,
+    latest.checked_at AS latest_checked_at,
+    rollup.uptime_24h,
+    rollup.uptime_7d,
+    rollup.uptime_30d,
+    recent.avg_response_time_24h,
+    COALESCE(NOT latest.is_successful, FALSE) AS is_down,
+    failures.consecutive_failures
+FROM endpoints e
+CROSS JOIN LATERAL (SELECT date_trunc('hour', timezone('utc', now())) AS current_hour) clock
+LEFT JOIN LATERAL (
+    SELECT hc.id, hc.checked_at, hc.is_successful
+    FROM health_checks hc
+    WHERE hc.endpoint_id = e.id
+    ORDER BY hc.checked_at DESC
+    LIMIT 1
+) latest ON TRUE
+LEFT JOIN LATERAL (
+    SELECT
+        {_uptime_since(24)} AS uptime_24h,
+        {_uptime_since(24 * 7)} AS uptime_7d,
+        {_uptime_since(24 * 30)} AS uptime_30d
+    FROM uptime_metrics um
+    WHERE um.endpoint_id = e.id
+      AND um.period_type = 'hour'
+      AND um.period_start >= current_hour - INTERVAL '{24 * 30 - 1} hours'
+) rollup ON TRUE
+LEFT JOIN LATERAL (
+    SELECT AVG(hc.response_time_ms) AS avg_response_time_24h
+    FROM health_checks hc
+    WHERE hc.endpoint_id = e.id AND hc.checked_at >= timezone('utc', now()) - INTERVAL '24 hours'
+) recent ON TRUE
+LEFT JOIN LATERAL (
+    SELECT COUNT(*) AS consecutive_failures
+    FROM health_checks hc
+    WHERE hc.endpoint_id = e.id
+      AND NOT hc.is_successful
+      AND hc.checked_at > COALESCE(
+          (SELECT MAX(ok.checked_at) FROM health_checks ok WHERE ok.endpoint_id = e.id AND ok.is_successful),
+          '-infinity'
+      )
+) failures ON TRUE
+"""
+
+# The unique index is what allows REFRESH MATERIALIZED VIEW CONCURRENTLY
+event.listen(SQLModel.metadata, "after_create", DDL(ENDPOINT_STATUS_VIEW_SQL))
+event.listen(
+    SQLModel.metadata,
+    "after_create",
+    DDL("CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_endpoint_status_endpoint ON mv_endpoint_status (endpoint_id)"),
+)
+# The view depends on the tables, so it has to go before drop_all() drops them
+event.listen(SQLModel.metadata, "before_drop", DDL("DROP MATERIALIZED VIEW IF EXISTS mv_endpoint_status"))
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
@@ -131,17 +499,17 @@ class Alert(SQLModel, table=True):
 
 class EndpointCreate(SQLModel, table=False):
     name: str = Field(max_length=200)
-    url: str = Field(max_length=1000)
+    url: str = Field(max_length=512)
     check_interval: int = Field(default=300, ge=60, le=3600)  # Between 1 minute and 1 hour
     expected_status_code: Optional[int] = Field(default=200, ge=100, le=599)
     timeout_seconds: int = Field(default=30, ge=1, le=300)
     description: str = Field(default="", max_length=500)
-    tags: List[str] = Field(default=[])
+    tags: List[str] = Field(default_factory=list)
 
 
 class EndpointUpdate(SQLModel, table=False):
     name: Optional[str] = Field(default=None, max_length=200)
-    url: Optional[str] = Field(default=None, max_length=1000)
+    url: Optional[str] = Field(default=None, max_length=512)
     check_interval: Optional[int] = Field(default=None, ge=60, le=3600)
     expected_status_code: Optional[int] = Field(default=None, ge=100, le=599)
     timeout_seconds: Optional[int] = Field(default=None, ge=1, le=300)
@@ -150,53 +518,71 @@ class EndpointUpdate(SQLModel, table=False):
     is_active: Optional[bool] = Field(default=None)
 
 
-class HealthCheckResult(SQLModel, table=False):
+# Plain dataclass rather than a SQLModel: one is built per endpoint per monitor tick
+@dataclass(slots=True, frozen=True, kw_only=True)
+class HealthCheckResult:
     endpoint_id: int
-    status_code: Optional[int] = Field(default=None)
-    response_time_ms: Optional[Decimal] = Field(default=None)
+    status_code: Optional[int] = None
+    response_time_ms: Optional[int] = None
     is_successful: bool
-    error_message: Optional[str] = Field(default=None, max_length=1000)
-    error_type: Optional[str] = Field(default=None, max_length=100)
-    dns_lookup_time_ms: Optional[Decimal] = Field(default=None)
-    tcp_connect_time_ms: Optional[Decimal] = Field(default=None)
-    tls_handshake_time_ms: Optional[Decimal] = Field(default=None)
-    response_size_bytes: Optional[int] = Field(default=None)
-    response_headers: Optional[Dict[str, str]] = Field(default=None)
+    error_message: Optional[str] = None
+    error_type: Optional[ErrorType] = None
+    dns_lookup_time_ms: Optional[int] = None
+    tcp_connect_time_ms: Optional[int] = None
+    tls_handshake_time_ms: Optional[int] = None
+    response_size_bytes: Optional[int] = None
+    response_headers: Optional[Dict[str, str]] = None
+
+    def __post_init__(self) -> None:
+        # Error messages come from the failing endpoint, so cut them to fit rather than drop the check
+        if self.error_message is not None and len(self.error_message) > 256:
+            object.__setattr__(self, "error_message", self.error_message[:256])
+        # An unknown label would only fail at insert time, taking the whole batch down with it
+        if self.error_type is not None:
+            object.__setattr__(self, "error_type", ErrorType(self.error_type))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Column values for a HealthCheck insert; response_headers go to HealthCheckDetails."""
+        return {field.name: getattr(self, field.name) for field in fields(self) if field.name != "response_headers"}
 
 
 class EndpointStatus(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True)  # type: ignore[assignment]
+
     endpoint: Endpoint
     latest_check: Optional[HealthCheck] = Field(default=None)
-    uptime_24h: Optional[Decimal] = Field(default=None)
-    uptime_7d: Optional[Decimal] = Field(default=None)
-    uptime_30d: Optional[Decimal] = Field(default=None)
-    avg_response_time_24h: Optional[Decimal] = Field(default=None)
+    uptime_24h: Optional[float] = Field(default=None)
+    uptime_7d: Optional[float] = Field(default=None)
+    uptime_30d: Optional[float] = Field(default=None)
+    avg_response_time_24h: Optional[float] = Field(default=None)
     is_down: bool = Field(default=False)
     consecutive_failures: int = Field(default=0)
 
 
 class UptimeStats(SQLModel, table=False):
+    model_config = ConfigDict(frozen=True, from_attributes=True)  # type: ignore[assignment]
+
     endpoint_id: int
     period: str  # "24h", "7d", "30d"
-    uptime_percentage: Decimal
+    uptime_percentage: float
     total_checks: int
     successful_checks: int
-    avg_response_time_ms: Optional[Decimal] = Field(default=None)
-    min_response_time_ms: Optional[Decimal] = Field(default=None)
-    max_response_time_ms: Optional[Decimal] = Field(default=None)
+    avg_response_time_ms: Optional[int] = Field(default=None)
+    min_response_time_ms: Optional[int] = Field(default=None)
+    max_response_time_ms: Optional[int] = Field(default=None)
 
 
 class SystemConfigUpdate(SQLModel, table=False):
     key: str = Field(max_length=100)
-    value: str = Field(max_length=1000)
-    value_type: str = Field(default="string", max_length=20)
+    value: str = Field(max_length=512)
+    value_type: ValueType = Field(default=ValueType.STRING)
     description: str = Field(default="", max_length=500)
 
 
 class AlertCreate(SQLModel, table=False):
     endpoint_id: int
-    alert_type: str = Field(max_length=50)
-    severity: str = Field(default="medium", max_length=20)
+    alert_type: AlertType
+    severity: Severity = Field(default=Severity.MEDIUM)
     title: str = Field(max_length=200)
-    message: str = Field(max_length=1000)
+    message: str = Field(max_length=512)
     trigger_data: Optional[Dict[str, Any]] = Field(default=None)
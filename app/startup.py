@@ -1,10 +1,12 @@
 from app.database import create_tables
+import app.maintenance
 from nicegui import ui
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    app.maintenance.create()
 
     @ui.page("/")
     def index():
@@ -0,0 +1,90 @@
+import pytest
+from sqlmodel import select
+
+from app.config_service import clear_config_cache, get_config
+from app.database import get_session, reset_db
+from app.models import CONFIG_VERSION_KEY, SystemConfig, ValueType
+
+# Every test here resets the database behind APP_DATABASE_URL, so they are deselected by default
+pytestmark = pytest.mark.sqlmodel
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    clear_config_cache()
+    yield
+    reset_db()
+    clear_config_cache()
+
+
+def test_get_config_casts_by_value_type(clean_db):
+    with get_session() as session:
+        session.add(SystemConfig(key="default_timeout", value="30", value_type=ValueType.INT))
+        session.add(SystemConfig(key="alerts_enabled", value="true", value_type=ValueType.BOOL))
+        session.add(SystemConfig(key="channels", value='["email", "slack"]', value_type=ValueType.JSON))
+        session.add(SystemConfig(key="banner", value="hello"))
+        session.commit()
+
+        assert get_config("default_timeout") == 30
+        assert get_config("alerts_enabled") is True
+        assert get_config("channels") == ["email", "slack"]
+        assert get_config("banner") == "hello"
+        assert get_config("missing") is None
+
+
+def test_get_config_sees_local_writes(clean_db):
+    with get_session() as session:
+        config = SystemConfig(key="default_timeout", value="30", value_type=ValueType.INT)
+        session.add(config)
+        session.commit()
+        assert get_config("default_timeout") == 30
+
+        config.value = "45"
+        session.add(config)
+        session.commit()
+
+        assert get_config("default_timeout") == 45
+
+
+def test_config_writes_bump_version_row(clean_db):
+    with get_session() as session:
+        session.add(SystemConfig(key="a", value="1"))
+        session.commit()
+        session.add(SystemConfig(key="b", value="2"))
+        session.commit()
+
+        version = session.exec(select(SystemConfig.value).where(SystemConfig.key == CONFIG_VERSION_KEY)).first()
+
+    assert version == "2"
+
+
+def test_get_config_serves_old_value_until_commit(clean_db):
+    with get_session() as writer:
+        config = SystemConfig(key="default_timeout", value="30", value_type=ValueType.INT)
+        writer.add(config)
+        writer.commit()
+
+        config.value = "45"
+        writer.add(config)
+        writer.flush()
+        assert get_config("default_timeout") == 30
+
+        writer.commit()
+        assert get_config("default_timeout") == 45
+
+
+def test_get_config_ignores_uncommitted_values(clean_db):
+    with get_session() as session:
+        config = SystemConfig(key="default_timeout", value="30", value_type=ValueType.INT)
+        session.add(config)
+        session.commit()
+
+        config.value = "99"
+        session.add(config)
+        session.flush()
+        # The flushed value is not committed yet, so the shared cache must not pick it up
+        assert get_config("default_timeout") == 30
+
+        session.rollback()
+        assert get_config("default_timeout") == 30
@@ -0,0 +1,302 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlmodel import select, text
+
+from app.database import get_session, reset_db
+from app.health_service import (
+    bulk_insert_alerts,
+    bulk_insert_health_checks,
+    ensure_partitions,
+    get_latest_check,
+    get_response_time_percentiles,
+    get_uptime_stats,
+    list_endpoint_rows,
+    load_endpoints_with_recent_checks,
+    refresh_endpoint_status_view,
+)
+from app.models import (
+    Alert,
+    AlertCreate,
+    AlertType,
+    Endpoint,
+    EndpointStatusView,
+    ErrorType,
+    HealthCheck,
+    HealthCheckDetails,
+    HealthCheckResult,
+    PeriodType,
+    Severity,
+    UptimeMetric,
+)
+
+# Every test here resets the database behind APP_DATABASE_URL, so they are deselected by default
+pytestmark = pytest.mark.sqlmodel
+
+
+@pytest.fixture()
+def clean_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture()
+def endpoint_id(clean_db) -> int:
+    with get_session() as session:
+        endpoint = Endpoint(name="Example", url="https://example.com")
+        session.add(endpoint)
+        session.commit()
+        session.refresh(endpoint)
+        assert endpoint.id is not None
+        return endpoint.id
+
+
+def test_health_check_insert_updates_hourly_rollup(endpoint_id):
+    checked_at = datetime.utcnow().replace(minute=10)
+    with get_session() as session:
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=checked_at, is_successful=True))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=checked_at, is_successful=False))
+        session.commit()
+
+        rollups = list(session.exec(select(UptimeMetric).where(UptimeMetric.endpoint_id == endpoint_id)).all())
+
+    assert len(rollups) == 1
+    assert rollups[0].period_type == PeriodType.HOUR
+    assert rollups[0].period_start == checked_at.replace(minute=0, second=0, microsecond=0)
+    assert rollups[0].total_checks == 2
+    assert rollups[0].successful_checks == 1
+
+
+def test_health_check_delete_updates_hourly_rollup(endpoint_id):
+    checked_at = datetime.utcnow().replace(minute=10)
+    with get_session() as session:
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=checked_at, is_successful=True))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=checked_at, is_successful=False))
+        session.commit()
+
+        succeeded = session.exec(select(HealthCheck).where(HealthCheck.is_successful)).one()
+        session.delete(succeeded)
+        session.commit()
+
+        rollup = session.exec(select(UptimeMetric).where(UptimeMetric.endpoint_id == endpoint_id)).one()
+
+    assert rollup.total_checks == 1
+    assert rollup.successful_checks == 0
+    assert rollup.uptime_percentage == 0.0
+
+
+def test_uptime_stats_sum_rollups_within_period(endpoint_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now, is_successful=True))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(hours=3), is_successful=False))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(days=3), is_successful=False))
+        session.commit()
+
+        stats_24h = get_uptime_stats(session, endpoint_id, "24h")
+        stats_7d = get_uptime_stats(session, endpoint_id, "7d")
+
+    assert stats_24h.total_checks == 2
+    assert stats_24h.uptime_percentage == 50.0
+    assert stats_7d.total_checks == 3
+    assert stats_7d.successful_checks == 1
+
+
+def test_uptime_stats_without_checks(endpoint_id):
+    with get_session() as session:
+        stats = get_uptime_stats(session, endpoint_id, "30d")
+
+    assert stats.total_checks == 0
+    assert stats.uptime_percentage == 0.0
+
+
+def test_uptime_stats_unknown_period(endpoint_id):
+    with get_session() as session:
+        with pytest.raises(ValueError):
+            get_uptime_stats(session, endpoint_id, "1y")
+
+
+def test_get_latest_check(endpoint_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        assert get_latest_check(session, endpoint_id) is None
+
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(minutes=5), status_code=500))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now, status_code=200, is_successful=True))
+        session.commit()
+
+        latest = get_latest_check(session, endpoint_id)
+
+        assert latest is not None
+        assert latest.checked_at == now
+        assert latest.status_code == 200
+        assert latest.is_successful
+
+
+def test_response_time_percentiles_ignore_failed_checks(endpoint_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        assert get_response_time_percentiles(session, endpoint_id, now - timedelta(hours=1)) == (None, None)
+
+        for response_time in range(1, 101):
+            session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now, response_time_ms=response_time))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now, error_type=ErrorType.TIMEOUT))
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(days=2), response_time_ms=5000))
+        session.commit()
+
+        p95, p99 = get_response_time_percentiles(session, endpoint_id, now - timedelta(hours=1))
+
+    assert p95 == 95
+    assert p99 == 99
+
+
+def test_list_endpoint_rows(endpoint_id):
+    with get_session() as session:
+        session.add(Endpoint(name="Another", url="https://example.org", is_active=False, tags=["prod"]))
+        session.commit()
+
+    with get_session() as session:
+        rows = list_endpoint_rows(session)
+
+        assert len(session.identity_map) == 0
+
+    assert [(row.name, row.url, row.is_active, row.tags) for row in rows] == [
+        ("Another", "https://example.org", False, ["prod"]),
+        ("Example", "https://example.com", True, []),
+    ]
+    assert rows[1].id == endpoint_id
+
+
+def test_load_endpoints_with_recent_checks(endpoint_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        other = Endpoint(name="Other", url="https://example.org")
+        session.add(other)
+        for minutes in range(5):
+            session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(minutes=minutes)))
+        session.commit()
+
+        endpoints = {endpoint.id: endpoint for endpoint in load_endpoints_with_recent_checks(session, limit=3)}
+
+    assert [check.checked_at for check in endpoints[endpoint_id].health_checks] == [
+        now - timedelta(minutes=minutes) for minutes in range(3)
+    ]
+    assert endpoints[other.id].health_checks == []
+
+
+def test_endpoint_health_checks_are_not_lazy_loaded(endpoint_id):
+    with get_session() as session:
+        endpoint = session.get(Endpoint, endpoint_id)
+        assert endpoint is not None
+        with pytest.raises(InvalidRequestError):
+            _ = endpoint.health_checks
+
+
+def test_bulk_insert_health_checks(endpoint_id):
+    results = [
+        HealthCheckResult(
+            endpoint_id=endpoint_id,
+            status_code=200,
+            response_time_ms=125,
+            is_successful=True,
+            response_headers={"content-type": "text/html"},
+        ),
+        HealthCheckResult(
+            endpoint_id=endpoint_id, is_successful=False, error_message="timed out", error_type=ErrorType.TIMEOUT
+        ),
+    ]
+    with get_session() as session:
+        bulk_insert_health_checks(session, results)
+
+        checks = list(session.exec(select(HealthCheck).where(HealthCheck.endpoint_id == endpoint_id)).all())
+        stats = get_uptime_stats(session, endpoint_id, "24h")
+        headers = {check.status_code: check.details.response_headers if check.details else None for check in checks}
+
+    assert len(checks) == 2
+    assert {check.response_time_ms for check in checks} == {125, None}
+    assert headers == {200: {"content-type": "text/html"}, None: None}
+    assert stats.total_checks == 2
+    assert stats.successful_checks == 1
+
+
+def test_delete_health_check_with_details(endpoint_id):
+    result = HealthCheckResult(endpoint_id=endpoint_id, is_successful=True, response_headers={"server": "nginx"})
+    with get_session() as session:
+        bulk_insert_health_checks(session, [result])
+        check = session.exec(select(HealthCheck).where(HealthCheck.endpoint_id == endpoint_id)).one()
+        assert check.details is not None
+
+        session.delete(check)
+        session.commit()
+
+        assert session.exec(select(HealthCheckDetails)).all() == []
+
+
+def test_bulk_insert_alerts(endpoint_id):
+    alerts = [
+        AlertCreate(endpoint_id=endpoint_id, alert_type=AlertType.DOWN, title="Down", message="Endpoint is down"),
+        AlertCreate(
+            endpoint_id=endpoint_id,
+            alert_type=AlertType.SLOW,
+            severity=Severity.LOW,
+            title="Slow",
+            message="Slow response",
+        ),
+    ]
+    with get_session() as session:
+        bulk_insert_alerts(session, alerts)
+
+        stored = list(session.exec(select(Alert).where(Alert.endpoint_id == endpoint_id)).all())
+
+    assert len(stored) == 2
+    assert all(alert.is_active for alert in stored)
+
+
+def test_ensure_partitions_creates_upcoming_months(clean_db):
+    next_month = (datetime.utcnow().replace(day=1) + timedelta(days=32)).replace(day=1)
+    with get_session() as session:
+        ensure_partitions(session, months_ahead=3)
+        # Safe to run repeatedly
+        ensure_partitions(session, months_ahead=3)
+
+        partitions = set(
+            session.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent IN ('health_checks'::regclass, 'health_check_details'::regclass)"
+                )
+            ).scalars()
+        )
+
+    assert f"health_checks_{next_month:%Y%m}" in partitions
+    assert f"health_check_details_{next_month:%Y%m}" in partitions
+    assert len(partitions) == 10
+
+
+def test_endpoint_status_view_snapshot(endpoint_id):
+    now = datetime.utcnow()
+    with get_session() as session:
+        session.add(HealthCheck(endpoint_id=endpoint_id, checked_at=now - timedelta(minutes=3), is_successful=True))
+        session.add(
+            HealthCheck(
+                endpoint_id=endpoint_id, checked_at=now - timedelta(minutes=2), is_successful=False, response_time_ms=10
+            )
+        )
+        session.add(
+            HealthCheck(
+                endpoint_id=endpoint_id, checked_at=now - timedelta(minutes=1), is_successful=False, response_time_ms=30
+            )
+        )
+        session.commit()
+        refresh_endpoint_status_view(session)
+
+        status = session.get(EndpointStatusView, endpoint_id)
+
+    assert status is not None
+    assert status.latest_check_id is not None
+    assert status.is_down
+    assert status.consecutive_failures == 2
+    assert status.avg_response_time_24h == 20.0
+    assert status.uptime_24h == 33.33
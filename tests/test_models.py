@@ -0,0 +1,16 @@
+import pytest
+
+from app.models import ErrorType, HealthCheckResult
+
+
+def test_health_check_result_validates_error_type():
+    result = HealthCheckResult(endpoint_id=1, is_successful=False, error_type="timeout")  # type: ignore[arg-type]
+    assert result.error_type is ErrorType.TIMEOUT
+
+    with pytest.raises(ValueError):
+        HealthCheckResult(endpoint_id=1, is_successful=False, error_type="bogus")  # type: ignore[arg-type]
+
+
+def test_health_check_result_truncates_error_message():
+    result = HealthCheckResult(endpoint_id=1, is_successful=False, error_message="x" * 1000)
+    assert result.error_message == "x" * 256